@@ -1,20 +1,12 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
 from streamlit_option_menu import option_menu
-from datetime import datetime
 
-# set page config FIRST, only once
-dark_mode = 'theme' in st.session_state and st.session_state['theme'] == 'dark'
-st.set_page_config(
-    page_title="Superstore Sales Dashboard",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# custom css for card style and theme
-st.markdown('''
+# card and sidebar styling
+CSS = '''
     <style>
     .metric-card {
         background: var(--secondary-background-color);
@@ -37,7 +29,26 @@ st.markdown('''
     .st-emotion-cache-1v0mbdj {background: #18122B !important;}
     .st-emotion-cache-1r4qj8v {background: #18122B !important;}
     </style>
-''', unsafe_allow_html=True)
+'''
+
+# (primary_bg, secondary_bg, accent, text) per theme
+THEME_COLORS = {
+    'dark': ("#18122B", "#22223B", "#a259ff", "#fff"),
+    'light': ("#fff", "#f7f7fa", "#a259ff", "#22223B"),
+}
+
+# set page config FIRST, only once
+dark_mode = 'theme' in st.session_state and st.session_state['theme'] == 'dark'
+st.set_page_config(
+    page_title="Superstore Sales Dashboard",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# custom css for card style and theme
+# streamlit drops any element a rerun does not emit, so this must be sent every run
+st.markdown(CSS, unsafe_allow_html=True)
 
 # theme toggle
 if 'theme' not in st.session_state:
@@ -47,16 +58,26 @@ def toggle_theme():
     st.session_state['theme'] = 'dark' if st.session_state['theme'] == 'light' else 'light'
 
 # set theme colors
-if st.session_state['theme'] == 'dark':
-    primary_bg = "#18122B"
-    secondary_bg = "#22223B"
-    accent = "#a259ff"
-    text = "#fff"
-else:
-    primary_bg = "#fff"
-    secondary_bg = "#f7f7fa"
-    accent = "#a259ff"
-    text = "#22223B"
+primary_bg, secondary_bg, accent, text = THEME_COLORS[st.session_state['theme']]
+
+# plotly templates per theme: the default chart look plus the dashboard colours, registered once per process
+@st.cache_resource
+def register_templates():
+    for name, (_, chart_bg, _, chart_text) in THEME_COLORS.items():
+        tpl = go.layout.Template(pio.templates[pio.templates.default])
+        tpl.layout.update(
+            title_font=dict(color=chart_text, size=22, family='sans-serif'),
+            font_color=chart_text,
+            xaxis=dict(color=chart_text, title_font=dict(color=chart_text, size=16), gridcolor=chart_bg),
+            yaxis=dict(color=chart_text, title_font=dict(color=chart_text, size=16), gridcolor=chart_bg),
+            legend=dict(font=dict(color=chart_text, size=14)),
+            plot_bgcolor=chart_bg,
+            paper_bgcolor=chart_bg,
+        )
+        pio.templates[f'salespulse_{name}'] = tpl
+
+register_templates()
+template = f"salespulse_{st.session_state['theme']}"
 
 # theme toggle button
 st.sidebar.button(
@@ -65,17 +86,167 @@ st.sidebar.button(
     use_container_width=True
 )
 
-# load data
+# text columns stored as categoricals so filters and groupbys work on integer codes
+CAT_COLS = ['region', 'state', 'city', 'category', 'sub_category', 'product_name', 'ship_mode', 'order_id']
+
+# load data (parquet is built from the csv by data_query/to_parquet.py)
 @st.cache_data
 def load_data():
-    df = pd.read_csv("data_query/superstore.csv")
-    # convert date columns to datetime
-    df['order_date'] = pd.to_datetime(df['order_date'])
-    df['ship_date'] = pd.to_datetime(df['ship_date'])
+    df = pd.read_parquet("data_query/superstore.parquet", engine='pyarrow')
+    for c in CAT_COLS:
+        df[c] = df[c].astype('category')
+    # 32-bit profit/quantity halve the bytes their reductions read;
+    # sales stays float64 since float32 rounding would show in the chart labels
+    df = df.astype({'profit': 'float32', 'quantity': 'int32'})
+    # keep rows in date order so date ranges are contiguous slices
+    df.sort_values('order_date', inplace=True, ignore_index=True)
+    # months since 1970-01 (the datetime64[M] epoch), for bincount-based monthly totals
+    df['month_idx'] = df['order_date'].values.astype('datetime64[M]').astype(np.int32)
     return df
 
-# load the data
-df = load_data()
+# every dimension the charts and metric cards total sales over
+SALES_DIMS = ['region', 'state', 'city', 'category', 'sub_category', 'product_name', 'ship_mode']
+# numeric columns totalled for the metric cards
+VALUE_COLS = ['sales', 'profit', 'quantity']
+# top-bar filter columns
+LOCATION_COLS = ['region', 'state', 'city']
+
+# groupby-sum of sales over a categorical column as a bincount of its codes,
+# keeping only the values present in the data
+def sum_by_codes(data, col):
+    codes = data[col].cat.codes.to_numpy()
+    categories = data[col].cat.categories
+    totals = np.bincount(codes, weights=data['sales'].to_numpy(), minlength=len(categories))
+    present = np.bincount(codes, minlength=len(categories)) > 0
+    return pd.Series(totals[present], index=pd.Index(categories[present], name=col), name='sales')
+
+# "All" + the sorted child values found under each parent value, e.g. cities per state
+def child_options(df, parent, child):
+    pairs = df[[parent, child]].drop_duplicates()
+    return {key: ["All"] + sorted(group[child].tolist()) for key, group in pairs.groupby(parent, observed=True)}
+
+# selectbox option lists never change after load, so build them once
+@st.cache_data
+def load_options():
+    df = load_data()
+    opts = {c: ["All"] + sorted(df[c].cat.categories.tolist()) for c in LOCATION_COLS}
+    # narrower lists for the state and city boxes once a region or state is picked
+    opts['states_by_region'] = child_options(df, 'region', 'state')
+    opts['cities_by_region'] = child_options(df, 'region', 'city')
+    opts['cities_by_state'] = child_options(df, 'state', 'city')
+    return opts
+
+# filtered rows for one widget state; cached so reruns with unchanged filters skip the work
+@st.cache_data(max_entries=32)
+def apply_filters(region, state, city, start_date, end_date):
+    df = load_data()
+    # rows are date-sorted, so the date range is a binary-searched slice
+    lo, hi = df['order_date'].searchsorted([pd.Timestamp(start_date), pd.Timestamp(end_date) + pd.Timedelta(days=1)])
+    window = df.iloc[lo:hi]
+    # then one boolean mask over the slice for the location filters
+    mask = np.ones(len(window), dtype=bool)
+    for col, value in (('region', region), ('state', state), ('city', city)):
+        if value != "All":
+            mask &= window[col].values == value
+    return window.iloc[mask]
+
+# every per-dimension sales total for a filter tuple, computed together and cached,
+# each ranked largest first so top-n charts only slice it
+@st.cache_data(max_entries=32)
+def dimension_sales(filters):
+    df_filtered = apply_filters(*filters)
+    return {dim: sum_by_codes(df_filtered, dim).sort_values(ascending=False) for dim in SALES_DIMS}
+
+# subcategory sales within one category, for the category page, ranked largest first
+@st.cache_data(max_entries=32)
+def subcategory_sales(filters, category):
+    df_filtered = apply_filters(*filters)
+    return sum_by_codes(df_filtered[df_filtered['category'].values == category], 'sub_category').sort_values(ascending=False)
+
+# value of a categorical column with the largest sales total, in one bincount pass
+def top_by_sales(data, col):
+    totals = np.bincount(data[col].cat.codes.to_numpy(), weights=data['sales'].to_numpy(dtype=np.float64))
+    return data[col].cat.categories[totals.argmax()]
+
+# summary card values for a filter tuple
+@st.cache_data(max_entries=32)
+def compute_metrics(filters):
+    df_filtered = apply_filters(*filters)
+    # one strided reduction for all three totals
+    sales, profit, quantity = df_filtered[VALUE_COLS].to_numpy(dtype=np.float64).sum(axis=0)
+    # distinct orders: mark each order_id code seen in the slice, no string hashing
+    order_ids = df_filtered['order_id'].cat
+    seen = np.zeros(len(order_ids.categories), dtype=bool)
+    seen[order_ids.codes.to_numpy()] = True
+    orders = int(seen.sum())
+    return [
+        ("Total Sales", f"${sales:,.0f}", "📈"),
+        ("Qty Sold", f"{int(quantity):,}", "🛒"),
+        ("Total Profit", f"${profit:,.0f}", "💰"),
+        ("Top Category", top_by_sales(df_filtered, 'category') if len(df_filtered) else "-", "🏆"),
+        ("Top City", top_by_sales(df_filtered, 'city') if len(df_filtered) else "-", "🏙️"),
+        ("Orders", f"{orders:,}", "📦"),
+    ]
+
+# most points the trends line chart is sent; more than that is wasted on the client
+MAX_TREND_POINTS = 200
+
+# largest-triangle-three-buckets: indices of n_out points that keep the line's visual shape
+def lttb(x, y, n_out):
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    # first and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[hi:nxt_hi].mean(), y[hi:nxt_hi].mean()
+        # pick the point forming the largest triangle with the last pick and the next bucket's mean
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+# monthly sales for the trends page
+@st.cache_data(max_entries=32)
+def sales_trend(filters):
+    df_filtered = apply_filters(*filters)
+    month_idx = df_filtered['month_idx'].to_numpy()
+    # rows stay date-sorted through filtering, so the first row holds the earliest month
+    base = month_idx[0] if len(month_idx) else 0
+    totals = np.bincount(month_idx - base, weights=df_filtered['sales'].to_numpy())
+    present = np.flatnonzero(np.bincount(month_idx - base))
+    sales = totals[present]
+    labels = (present + base).astype('datetime64[M]')
+    # downsample when the range is wider than the chart can show, keeping peaks and dips
+    keep = lttb(present.astype(np.float64), sales, MAX_TREND_POINTS)
+    sales, labels = sales[keep], labels[keep]
+    # datetime labels give plotly a date axis, so gaps between months keep their width
+    return pd.DataFrame({'order_date': labels.astype('datetime64[ns]'), 'sales': sales})
+
+# mean days between order and shipment
+@st.cache_data(max_entries=32)
+def avg_ship_days(filters):
+    df_filtered = apply_filters(*filters)
+    if len(df_filtered) == 0:
+        return np.nan
+    # subtract the raw datetime64 arrays; dividing by one day keeps this unit-agnostic
+    delays = df_filtered['ship_date'].values - df_filtered['order_date'].values
+    return (delays / np.timedelta64(1, 'D')).mean()
+
+# keep the date bounds and option lists per session; the frame itself stays in the
+# process-wide cache, which the cached helpers read on a miss
+if 'opts' not in st.session_state:
+    df = load_data()
+    # rows are date-sorted, so the bounds are the first and last rows
+    st.session_state['date_bounds'] = (df['order_date'].iloc[0], df['order_date'].iloc[-1])
+    st.session_state['opts'] = load_options()
+min_date, max_date = st.session_state['date_bounds']
+opts = st.session_state['opts']
 
 # sidebar navigation
 with st.sidebar:
@@ -95,42 +266,37 @@ with st.sidebar:
 # filter widgets (top bar)
 col1, col2, col3, col4, col5 = st.columns([1,1,1,1,2])
 with col1:
-    region = st.selectbox("Select Region", ["All"] + sorted(df['region'].unique().tolist()))
+    region = st.selectbox("Select Region", opts['region'])
 with col2:
-    state = st.selectbox("Select State", ["All"] + sorted(df['state'].unique().tolist()))
+    state_opts = opts['states_by_region'][region] if region != "All" else opts['state']
+    state = st.selectbox("Select State", state_opts)
 with col3:
-    city = st.selectbox("Pick the City", ["All"] + sorted(df['city'].unique().tolist()))
+    if state != "All":
+        city_opts = opts['cities_by_state'][state]
+    elif region != "All":
+        city_opts = opts['cities_by_region'][region]
+    else:
+        city_opts = opts['city']
+    city = st.selectbox("Pick the City", city_opts)
 with col4:
-    min_date = df['order_date'].min()
-    max_date = df['order_date'].max()
     start_date = st.date_input("Start Date", min_value=min_date, max_value=max_date, value=min_date)
 with col5:
     end_date = st.date_input("End Date", min_value=min_date, max_value=max_date, value=max_date)
 
-# filter data
-df_filtered = df.copy()
-if region != "All":
-    df_filtered = df_filtered[df_filtered['region'] == region]
-if state != "All":
-    df_filtered = df_filtered[df_filtered['state'] == state]
-if city != "All":
-    df_filtered = df_filtered[df_filtered['city'] == city]
-df_filtered = df_filtered[(df_filtered['order_date'] >= pd.to_datetime(start_date)) & (df_filtered['order_date'] <= pd.to_datetime(end_date))]
+# filter state shared by every cached aggregation
+filters = (region, state, city, start_date, end_date)
 
 # summary metrics (top cards)
 metric_cols = st.columns(6)
-metrics = [
-    ("Total Sales", f"${df_filtered['sales'].sum():,.0f}", "📈"),
-    ("Qty Sold", f"{df_filtered['quantity'].sum():,}", "🛒"),
-    ("Total Profit", f"${df_filtered['profit'].sum():,.0f}", "💰"),
-    ("Top Category", df_filtered.groupby('category')['sales'].sum().idxmax() if not df_filtered.empty else "-", "🏆"),
-    ("Top City", df_filtered.groupby('city')['sales'].sum().idxmax() if not df_filtered.empty else "-", "🏙️"),
-    ("Orders", f"{df_filtered['order_id'].nunique():,}", "📦"),
-]
+metrics = compute_metrics(filters)
 for i, (label, value, icon) in enumerate(metrics):
     with metric_cols[i]:
         st.markdown(f'<div class="metric-card"><span class="metric-label">{icon} {label}</span><div class="metric-value">{value}</div></div>', unsafe_allow_html=True)
 
+# plotly.express is only imported once a chart page is opened
+if selected != "Home":
+    import plotly.express as px
+
 # main content by page
 if selected == "Home":
     st.title("SUPERSTORE SALES DASHBOARD")
@@ -142,53 +308,22 @@ if selected == "Home":
 
 elif selected == "Sales":
     st.header("Sales by Category & Region")
+    dims = dimension_sales(filters)
     c1, c2 = st.columns(2)
     with c1:
-        cat_sales = df_filtered.groupby('category')['sales'].sum().reset_index()
-        fig = px.bar(cat_sales, x='category', y='sales', color='category', color_discrete_sequence=[accent]*3)
-        fig.update_layout(
-            title='Sales by Category',
-            title_font=dict(color=text, size=22, family='sans-serif'),
-            font_color=text,
-            xaxis=dict(
-                color=text,
-                title='Category',
-                title_font=dict(color=text, size=16),
-                gridcolor=secondary_bg
-            ),
-            yaxis=dict(
-                color=text,
-                title='Sales',
-                title_font=dict(color=text, size=16),
-                gridcolor=secondary_bg
-            ),
-            legend=dict(
-                font=dict(color=text, size=14)
-            ),
-            plot_bgcolor=secondary_bg,
-            paper_bgcolor=secondary_bg,
-        )
+        cat_sales = dims['category'].sort_index().reset_index()
+        fig = px.bar(cat_sales, x='category', y='sales', color='category', color_discrete_sequence=[accent]*3, template=template)
+        fig.update_layout(title='Sales by Category', xaxis_title='Category', yaxis_title='Sales')
         fig.update_traces(
-            texttemplate='%{y:,}',
+            texttemplate='%{y:,.2f}',
             textfont=dict(color=text, size=14),
             textposition='auto'
         )
         st.plotly_chart(fig, use_container_width=True)
     with c2:
-        reg_sales = df_filtered.groupby('region')['sales'].sum().reset_index()
-        fig = px.pie(reg_sales, values='sales', names='region', color_discrete_sequence=[accent, '#6c47b6', '#c3a6ff', '#e0d6f7'])
-        fig.update_layout(
-            title='Sales by Region',
-            title_font=dict(color=text, size=22, family='sans-serif'),
-            font_color=text,
-            xaxis=dict(color=text),
-            yaxis=dict(color=text),
-            legend=dict(
-                font=dict(color=text, size=14)
-            ),
-            plot_bgcolor=secondary_bg,
-            paper_bgcolor=secondary_bg,
-        )
+        reg_sales = dims['region'].sort_index().reset_index()
+        fig = px.pie(reg_sales, values='sales', names='region', color_discrete_sequence=[accent, '#6c47b6', '#c3a6ff', '#e0d6f7'], template=template)
+        fig.update_layout(title='Sales by Region')
         fig.update_traces(
             texttemplate='%{percent}',
             textfont=dict(color=text, size=14),
@@ -198,64 +333,21 @@ elif selected == "Sales":
 
 elif selected == "Trends":
     st.header("Sales By Time")
-    trend = df_filtered.groupby(df_filtered['order_date'].dt.to_period('M'))['sales'].sum().reset_index()
-    trend['order_date'] = trend['order_date'].astype(str)
-    fig = px.line(trend, x='order_date', y='sales', markers=True, color_discrete_sequence=[accent])
-    fig.update_layout(
-        title='Sales Over Time',
-        title_font=dict(color=text, size=22, family='sans-serif'),
-        font_color=text,
-        xaxis=dict(
-            color=text,
-            title='Time',
-            title_font=dict(color=text, size=16),
-            gridcolor=secondary_bg
-        ),
-        yaxis=dict(
-            color=text,
-            title='Sales',
-            title_font=dict(color=text, size=16),
-            gridcolor=secondary_bg
-        ),
-        legend=dict(
-            font=dict(color=text, size=14)
-        ),
-        plot_bgcolor=secondary_bg,
-        paper_bgcolor=secondary_bg,
-    )
+    trend = sales_trend(filters)
+    fig = px.line(trend, x='order_date', y='sales', markers=True, color_discrete_sequence=[accent], template=template)
+    fig.update_layout(title='Sales Over Time', xaxis_title='Time', yaxis_title='Sales')
     fig.update_traces(line_width=3)
     st.plotly_chart(fig, use_container_width=True)
 
 elif selected == "Category":
     st.header("Category Analysis")
-    cat = st.selectbox("Choose Category", ["All"] + sorted(df_filtered['category'].unique().tolist()))
-    data = df_filtered if cat == "All" else df_filtered[df_filtered['category'] == cat]
-    subcat_sales = data.groupby('sub_category')['sales'].sum().sort_values(ascending=False).reset_index()
-    fig = px.bar(subcat_sales, x='sub_category', y='sales', color='sub_category', color_discrete_sequence=px.colors.sequential.Purples)
-    fig.update_layout(
-        title='Sales by Subcategory',
-        title_font=dict(color=text, size=22, family='sans-serif'),
-        font_color=text,
-        xaxis=dict(
-            color=text,
-            title='Subcategory',
-            title_font=dict(color=text, size=16),
-            gridcolor=secondary_bg
-        ),
-        yaxis=dict(
-            color=text,
-            title='Sales',
-            title_font=dict(color=text, size=16),
-            gridcolor=secondary_bg
-        ),
-        legend=dict(
-            font=dict(color=text, size=14)
-        ),
-        plot_bgcolor=secondary_bg,
-        paper_bgcolor=secondary_bg,
-    )
+    dims = dimension_sales(filters)
+    cat = st.selectbox("Choose Category", ["All"] + sorted(dims['category'].index.tolist()))
+    subcat_sales = (dims['sub_category'] if cat == "All" else subcategory_sales(filters, cat)).reset_index()
+    fig = px.bar(subcat_sales, x='sub_category', y='sales', color='sub_category', color_discrete_sequence=px.colors.sequential.Purples, template=template)
+    fig.update_layout(title='Sales by Subcategory', xaxis_title='Subcategory', yaxis_title='Sales')
     fig.update_traces(
-        texttemplate='%{y:,}',
+        texttemplate='%{y:,.2f}',
         textfont=dict(color=text, size=14),
         textposition='auto'
     )
@@ -263,32 +355,12 @@ elif selected == "Category":
 
 elif selected == "Product":
     st.header("Product Performance")
-    top_products = df_filtered.groupby('product_name')['sales'].sum().sort_values(ascending=False).head(10).reset_index()
-    fig = px.bar(top_products, x='product_name', y='sales', color='sales', color_continuous_scale=px.colors.sequential.Purples)
-    fig.update_layout(
-        title='Top Products by Sales',
-        title_font=dict(color=text, size=22, family='sans-serif'),
-        font_color=text,
-        xaxis=dict(
-            color=text,
-            title='Product',
-            title_font=dict(color=text, size=16),
-            gridcolor=secondary_bg
-        ),
-        yaxis=dict(
-            color=text,
-            title='Sales',
-            title_font=dict(color=text, size=16),
-            gridcolor=secondary_bg
-        ),
-        legend=dict(
-            font=dict(color=text, size=14)
-        ),
-        plot_bgcolor=secondary_bg,
-        paper_bgcolor=secondary_bg,
-    )
+    dims = dimension_sales(filters)
+    top_products = dims['product_name'].head(10).reset_index()
+    fig = px.bar(top_products, x='product_name', y='sales', color='sales', color_continuous_scale=px.colors.sequential.Purples, template=template)
+    fig.update_layout(title='Top Products by Sales', xaxis_title='Product', yaxis_title='Sales')
     fig.update_traces(
-        texttemplate='%{y:,}',
+        texttemplate='%{y:,.2f}',
         textfont=dict(color=text, size=14),
         textposition='auto'
     )
@@ -296,65 +368,24 @@ elif selected == "Product":
 
 elif selected == "Location":
     st.header("Sales by State & City")
+    dims = dimension_sales(filters)
     c1, c2 = st.columns(2)
     with c1:
-        state_sales = df_filtered.groupby('state')['sales'].sum().sort_values(ascending=False).head(10).reset_index()
-        fig = px.bar(state_sales, x='state', y='sales', color='sales', color_continuous_scale=px.colors.sequential.Purples)
-        fig.update_layout(
-            title='Sales by State',
-            title_font=dict(color=text, size=22, family='sans-serif'),
-            font_color=text,
-            xaxis=dict(
-                color=text,
-                title='State',
-                title_font=dict(color=text, size=16),
-                gridcolor=secondary_bg
-            ),
-            yaxis=dict(
-                color=text,
-                title='Sales',
-                title_font=dict(color=text, size=16),
-                gridcolor=secondary_bg
-            ),
-            legend=dict(
-                font=dict(color=text, size=14)
-            ),
-            plot_bgcolor=secondary_bg,
-            paper_bgcolor=secondary_bg,
-        )
+        state_sales = dims['state'].head(10).reset_index()
+        fig = px.bar(state_sales, x='state', y='sales', color='sales', color_continuous_scale=px.colors.sequential.Purples, template=template)
+        fig.update_layout(title='Sales by State', xaxis_title='State', yaxis_title='Sales')
         fig.update_traces(
-            texttemplate='%{y:,}',
+            texttemplate='%{y:,.2f}',
             textfont=dict(color=text, size=14),
             textposition='auto'
         )
         st.plotly_chart(fig, use_container_width=True)
     with c2:
-        city_sales = df_filtered.groupby('city')['sales'].sum().sort_values(ascending=False).head(10).reset_index()
-        fig = px.bar(city_sales, x='city', y='sales', color='sales', color_continuous_scale=px.colors.sequential.Purples)
-        fig.update_layout(
-            title='Sales by City',
-            title_font=dict(color=text, size=22, family='sans-serif'),
-            font_color=text,
-            xaxis=dict(
-                color=text,
-                title='City',
-                title_font=dict(color=text, size=16),
-                gridcolor=secondary_bg
-            ),
-            yaxis=dict(
-                color=text,
-                title='Sales',
-                title_font=dict(color=text, size=16),
-                gridcolor=secondary_bg
-            ),
-            legend=dict(
-                font=dict(color=text, size=14)
-            ),
-            plot_bgcolor=secondary_bg,
-            paper_bgcolor=secondary_bg,
-        )
+        city_sales = dims['city'].head(10).reset_index()
+        fig = px.bar(city_sales, x='city', y='sales', color='sales', color_continuous_scale=px.colors.sequential.Purples, template=template)
+        fig.update_layout(title='Sales by City', xaxis_title='City', yaxis_title='Sales')
         fig.update_traces(
-            texttemplate='%{y:,}',
+            texttemplate='%{y:,.2f}',
             textfont=dict(color=text, size=14),
             textposition='auto'
         )
@@ -362,20 +393,10 @@ elif selected == "Location":
 
 elif selected == "Shipping":
     st.header("Shipping Analysis")
-    ship_mode = df_filtered.groupby('ship_mode')['sales'].sum().reset_index()
-    fig = px.pie(ship_mode, values='sales', names='ship_mode', color_discrete_sequence=[accent, '#6c47b6', '#c3a6ff', '#e0d6f7'])
-    fig.update_layout(
-        title='Shipping Mode Distribution',
-        title_font=dict(color=text, size=22, family='sans-serif'),
-        font_color=text,
-        xaxis=dict(color=text),
-        yaxis=dict(color=text),
-        legend=dict(
-            font=dict(color=text, size=14)
-        ),
-        plot_bgcolor=secondary_bg,
-        paper_bgcolor=secondary_bg,
-    )
+    dims = dimension_sales(filters)
+    ship_mode = dims['ship_mode'].sort_index().reset_index()
+    fig = px.pie(ship_mode, values='sales', names='ship_mode', color_discrete_sequence=[accent, '#6c47b6', '#c3a6ff', '#e0d6f7'], template=template)
+    fig.update_layout(title='Shipping Mode Distribution')
     fig.update_traces(
         texttemplate='%{percent}',
         textfont=dict(color=text, size=14),
@@ -383,5 +404,5 @@ elif selected == "Shipping":
     )
     st.plotly_chart(fig, use_container_width=True)
     st.write("Average Shipping Time:")
-    avg_ship = (df_filtered['ship_date'] - df_filtered['order_date']).dt.days.mean()
+    avg_ship = avg_ship_days(filters)
     st.metric("Avg. Shipping Days", f"{avg_ship:.1f} days" if not pd.isna(avg_ship) else "-") 
\ No newline at end of file
@@ -0,0 +1,9 @@
+import pandas as pd
+
+# one-time conversion of the superstore csv into parquet for the dashboard
+# run from the repo root: python data_query/to_parquet.py
+CAT_COLS = ['region', 'state', 'city', 'category', 'sub_category', 'product_name', 'ship_mode', 'order_id']
+
+df = pd.read_csv("data_query/superstore.csv", parse_dates=['order_date', 'ship_date'])
+df = df.astype({c: 'category' for c in CAT_COLS})
+df.to_parquet("data_query/superstore.parquet", engine='pyarrow', index=False)